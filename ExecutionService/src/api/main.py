@@ -1,6 +1,69 @@
-from fastapi import FastAPI
+import asyncio
+import os
+from contextlib import asynccontextmanager, suppress
+
+from anyio import to_thread
+import orjson
+from fastapi import FastAPI, Response
+from fastapi.encoders import jsonable_encoder
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.openapi.utils import validation_error_definition, validation_error_response_definition
+from fastapi.responses import ORJSONResponse
 from .routers import executions, monitoring
+from ..services.deps import get_execution_service
+from ..services.worker import run_execution_worker
+
+# Sync endpoints are dispatched on AnyIO's worker threadpool; the default of 40
+# tokens stalls under bursts of concurrent polling clients.
+THREADPOOL_SIZE = 200
+
+# CORS is only needed when browsers call the API cross-origin; ENABLE_CORS=false skips the
+# middleware entirely for same-origin or server-to-server deployments.
+ENABLE_CORS = os.getenv("ENABLE_CORS", "true").strip().lower() not in ("0", "false", "no", "off")
+
+# Parsed once at import so the middleware does not rebuild the list per app.
+ALLOWED_ORIGINS = tuple(
+    origin.strip() for origin in os.getenv("ALLOWED_ORIGINS", "*").split(",") if origin.strip()
+)
+ALLOWED_METHODS = ("GET", "POST")
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Application lifespan: size the threadpool used for sync endpoints, construct the long-lived
+    service objects once and start the background worker that processes submitted executions;
+    the worker is cancelled on shutdown.
+    """
+    to_thread.current_default_thread_limiter().total_tokens = THREADPOOL_SIZE
+    # Endpoints read the service from app.state instead of resolving a dependency per request.
+    # A database-backed repository should open its connection pool here as well, so requests
+    # never pay for connection setup.
+    app.state.svc = get_execution_service()
+    app.state.execution_queue = asyncio.Queue()
+    worker = asyncio.create_task(run_execution_worker(app.state.execution_queue))
+    yield
+    worker.cancel()
+    with suppress(asyncio.CancelledError):
+        await worker
+
+def _install_openapi_components(app: FastAPI) -> None:
+    """
+    Extend the generated OpenAPI document with schemas for routes that parse their own body,
+    so their $refs resolve regardless of which other models the API happens to publish.
+    """
+    generate = app.openapi
+
+    def openapi():
+        if app.openapi_schema is None:
+            schemas = generate().setdefault("components", {}).setdefault("schemas", {})
+            # Encoded like FastAPI encodes its own document (None-valued keywords dropped)
+            for name, schema in jsonable_encoder(executions.OPENAPI_COMPONENTS, exclude_none=True).items():
+                schemas.setdefault(name, schema)
+            schemas.setdefault("HTTPValidationError", validation_error_response_definition)
+            schemas.setdefault("ValidationError", validation_error_definition)
+        return app.openapi_schema
+
+    app.openapi = openapi
 
 def create_app() -> FastAPI:
     """
@@ -15,25 +78,48 @@ def create_app() -> FastAPI:
             {"name": "logs", "description": "Retrieve execution logs and streaming info."},
             {"name": "monitoring", "description": "Self-monitoring, health, and metrics."},
         ],
+        lifespan=lifespan,
+        default_response_class=ORJSONResponse,
     )
 
-    app.add_middleware(
-        CORSMiddleware,
-        allow_origins=["*"],
-        allow_credentials=True,
-        allow_methods=["*"],
-        allow_headers=["*"],
-    )
+    if ENABLE_CORS:
+        app.add_middleware(
+            CORSMiddleware,
+            allow_origins=ALLOWED_ORIGINS,
+            # Credentialed requests may not be answered with a wildcard origin (Fetch spec)
+            allow_credentials="*" not in ALLOWED_ORIGINS,
+            allow_methods=ALLOWED_METHODS,
+            allow_headers=["*"],
+        )
 
     # Register routers
     app.include_router(executions.router)
     app.include_router(monitoring.router)
+    _install_openapi_components(app)
     return app
 
 app = create_app()
 
+# Constant body encoded once; liveness probes then skip serialization entirely.
+_HEALTHY_BODY = orjson.dumps({"message": "Healthy"})
+
 # PUBLIC_INTERFACE
 @app.get("/", tags=["monitoring"], summary="Health Check")
 def health_check():
     """Basic health check endpoint for liveness probes."""
-    return {"message": "Healthy"}
+    return Response(content=_HEALTHY_BODY, media_type="application/json")
+
+if __name__ == "__main__":
+    import uvicorn
+
+    # uvloop (libuv event loop) and httptools (C HTTP parser) are both pinned in requirements.txt
+    uvicorn.run(
+        "src.api.main:app",
+        host=os.getenv("HOST", "0.0.0.0"),
+        port=int(os.getenv("PORT", "8000")),
+        loop="uvloop",
+        http="httptools",
+        # Executions, logs and the work queue live in process memory, so extra workers would not
+        # see each other's executions; raise this only with a shared database-backed repository.
+        workers=int(os.getenv("WEB_CONCURRENCY", "1")),
+    )
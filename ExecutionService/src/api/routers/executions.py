@@ -1,5 +1,11 @@
+import email.message
+import json
+import re
 from typing import Optional, List
-from fastapi import APIRouter, Depends, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.exceptions import RequestValidationError
+from pydantic import TypeAdapter, ValidationError
+from starlette.concurrency import run_in_threadpool
 from ...models.schemas import (
     ExecutionRequest,
     SubmitResponse,
@@ -7,11 +13,78 @@ from ...models.schemas import (
     ExecutionStatus,
     LogsResponse,
 )
-from ...services.deps import get_execution_service
 from ...services.execution_service import ExecutionService
 
 router = APIRouter(prefix="/executions", tags=["executions"])
 
+# Built once at import; submit_execution validates the raw body with it in a single pass.
+_REQUEST_ADAPTER = TypeAdapter(ExecutionRequest)
+
+# submit_execution reads the raw body, so FastAPI no longer derives its schema. These are the
+# components it would have published (ExecutionRequest plus the models it references); the app
+# merges them into components/schemas when building the OpenAPI document.
+_request_schema = ExecutionRequest.model_json_schema(ref_template="#/components/schemas/{model}")
+OPENAPI_COMPONENTS = {**_request_schema.pop("$defs", {}), "ExecutionRequest": _request_schema}
+
+# Log lines round-trip lone surrogates (undecodable process output), which JSON encoders
+# reject; they are swapped for U+FFFD when a page is served, leaving stored lines untouched.
+_SURROGATES = re.compile("[\ud800-\udfff]")
+
+def _read_logs(svc: ExecutionService, execution_id: str, offset: int, limit: int) -> Optional[LogsResponse]:
+    resp = svc.logs(execution_id, offset=offset, limit=limit)
+    if resp and any(_SURROGATES.search(line) for line in resp.lines):
+        resp = resp.model_copy(update={"lines": [_SURROGATES.sub("\ufffd", line) for line in resp.lines]})
+    return resp
+
+def _is_json_media_type(content_type: Optional[str]) -> bool:
+    """Same rule FastAPI applies to body parameters: no header, application/json or */*+json."""
+    if not content_type:
+        return True
+    message = email.message.Message()
+    message["content-type"] = content_type
+    if message.get_content_maintype() != "application":
+        return False
+    subtype = message.get_content_subtype()
+    return subtype == "json" or subtype.endswith("+json")
+
+def _body_errors(exc: ValidationError) -> list:
+    return [{**err, "loc": ("body", *err["loc"])} for err in exc.errors(include_url=False)]
+
+def _parse_execution_request(body: bytes, content_type: Optional[str]) -> ExecutionRequest:
+    """
+    Validate a raw submit body, raising RequestValidationError shaped like FastAPI's own errors.
+    Non-JSON media types are rejected before parsing: text/plain POSTs are CORS "simple"
+    requests that skip preflight, so accepting them would bypass the origin allow-list.
+    """
+    if not _is_json_media_type(content_type):
+        # FastAPI hands non-JSON bodies to the model as raw bytes; report the error it produces
+        raise RequestValidationError(
+            [{"type": "model_attributes_type", "loc": ("body",),
+              "msg": "Input should be a valid dictionary or object to extract fields from", "input": body}]
+        )
+    try:
+        return _REQUEST_ADAPTER.validate_json(body)
+    except ValidationError as exc:
+        if exc.errors()[0]["type"] != "json_invalid":
+            raise RequestValidationError(_body_errors(exc))
+    # Malformed JSON (rare path): re-parse with the stdlib for FastAPI's decode-error shape
+    try:
+        json.loads(body)
+    except json.JSONDecodeError as e:
+        raise RequestValidationError(
+            [{"type": "json_invalid", "loc": ("body", e.pos), "msg": "JSON decode error", "input": {},
+              "ctx": {"error": e.msg}}]
+        )
+    except ValueError:
+        pass
+    # Undecodable bytes, or input the stdlib accepts but pydantic does not: FastAPI's generic answer
+    raise HTTPException(status_code=400, detail="There was an error parsing the body")
+
+# The repository/service calls block on locks. Detail and list endpoints are plain `def`, so
+# Starlette runs them on the AnyIO threadpool. Submit and logs are `async def` because they
+# await the body, the work queue or the long-poll; their blocking calls are offloaded with
+# run_in_threadpool so the event loop never holds a repository lock.
+
 # PUBLIC_INTERFACE
 @router.post(
     "",
@@ -21,21 +94,37 @@ router = APIRouter(prefix="/executions", tags=["executions"])
     responses={
         201: {"description": "Execution accepted."},
         400: {"description": "Invalid request."},
+        422: {
+            "description": "Validation Error",
+            "content": {"application/json": {"schema": {"$ref": "#/components/schemas/HTTPValidationError"}}},
+        },
     },
     status_code=201,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {"application/json": {"schema": {"$ref": "#/components/schemas/ExecutionRequest"}}},
+        },
+    },
 )
-def submit_execution(
-    payload: ExecutionRequest,
-    svc: ExecutionService = Depends(get_execution_service),
+async def submit_execution(
+    request: Request,
 ):
     """
     Endpoint to submit a new execution.
     Parameters:
-    - payload: ExecutionRequest body with git source, entrypoint, parameters, environment, etc.
+    - request body: ExecutionRequest JSON with git source, entrypoint, parameters, environment, etc.
+      It is parsed and validated directly from bytes with a prebuilt TypeAdapter.
 
-    Returns: SubmitResponse with assigned execution id and initial status.
+    Returns: SubmitResponse with assigned execution id and initial status (queued); the execution
+    itself is processed asynchronously by the background worker.
     """
-    resp = svc.submit(payload)
+    payload = _parse_execution_request(await request.body(), request.headers.get("content-type"))
+    svc: ExecutionService = request.app.state.svc
+    # submit() takes repository locks; keep it off the event loop like the sync endpoints
+    resp = await run_in_threadpool(svc.submit, payload)
+    # Running the execution is left to the background worker so the response returns immediately
+    await request.app.state.execution_queue.put((svc, resp.execution_id, payload))
     return resp
 
 # PUBLIC_INTERFACE
@@ -47,11 +136,15 @@ def submit_execution(
 )
 def get_execution(
     execution_id: str,
-    svc: ExecutionService = Depends(get_execution_service),
+    request: Request,
 ):
     """
     Retrieve execution detail, including git info, parameters, status, results, and logs pointer.
     """
+    svc: ExecutionService = request.app.state.svc
+    # Cheap membership probe first so unknown ids never take the repository lock
+    if not svc.contains(execution_id):
+        raise HTTPException(status_code=404, detail="Execution not found")
     detail = svc.get(execution_id)
     if not detail:
         raise HTTPException(status_code=404, detail="Execution not found")
@@ -65,14 +158,16 @@ def get_execution(
     description="List recent executions, optionally filtered by status.",
 )
 def list_executions(
+    request: Request,
     status: Optional[ExecutionStatus] = Query(None, description="Optional filter by status."),
     limit: int = Query(50, ge=1, le=200, description="Number of records to return."),
-    svc: ExecutionService = Depends(get_execution_service),
 ):
     """
     List recent executions ordered by creation time, latest first.
+    The body is assembled from per-execution JSON cached by the service, bypassing re-serialization.
     """
-    return svc.list(limit=limit, status=status)
+    svc: ExecutionService = request.app.state.svc
+    return Response(content=svc.list_json(limit=limit, status=status), media_type="application/json")
 
 # PUBLIC_INTERFACE
 @router.get(
@@ -80,19 +175,35 @@ def list_executions(
     response_model=LogsResponse,
     tags=["logs"],
     summary="Get execution logs",
-    description="Retrieve captured logs for an execution. Supports incremental fetching using offset.",
+    description=(
+        "Retrieve captured logs for an execution. Supports incremental fetching using offset, "
+        "and long-polling via wait_ms when no new lines are available yet."
+    ),
 )
-def get_execution_logs(
+async def get_execution_logs(
     execution_id: str,
+    request: Request,
     offset: int = Query(0, ge=0, description="Starting offset to read logs from."),
     limit: int = Query(200, ge=1, le=1000, description="Max number of lines to return."),
-    svc: ExecutionService = Depends(get_execution_service),
+    wait_ms: int = Query(
+        0, ge=0, le=30000, description="If no lines are available past offset, wait up to this long for new ones."
+    ),
 ):
     """
     Fetch logs for an execution with pagination support via offset/limit.
     Returns an eof flag when no further logs are expected.
+    With wait_ms > 0 the request hangs until new lines arrive, the execution finishes or the
+    wait elapses, instead of the client busy-polling; on timeout the empty page is returned.
     """
-    resp = svc.logs(execution_id, offset=offset, limit=limit)
+    svc: ExecutionService = request.app.state.svc
+    if not svc.contains(execution_id):
+        raise HTTPException(status_code=404, detail="Execution not found")
+    # Reads take the shard lock and decode lines, so they run on the threadpool; only the
+    # long-poll wait itself stays on the event loop.
+    resp = await run_in_threadpool(_read_logs, svc, execution_id, offset, limit)
     if not resp:
         raise HTTPException(status_code=404, detail="Execution not found")
+    if wait_ms and not resp.lines and not resp.eof:
+        if await svc.wait_for_logs(execution_id, offset, wait_ms / 1000):
+            resp = await run_in_threadpool(_read_logs, svc, execution_id, offset, limit)
     return resp
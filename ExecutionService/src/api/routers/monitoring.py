@@ -1,10 +1,20 @@
-from fastapi import APIRouter, Depends
+import orjson
+from fastapi import APIRouter, Request, Response
 from ...models.schemas import MonitoringInfo
-from ...services.deps import get_execution_service
 from ...services.execution_service import ExecutionService
 
 router = APIRouter(prefix="/monitoring", tags=["monitoring"])
 
+# Constant payloads are encoded once at import; those endpoints return the bytes as-is.
+_READY_BODY = orjson.dumps({"status": "ready"})
+_WEBSOCKET_DOCS_BODY = orjson.dumps({
+    "websocket": "planned",
+    "note": "Real-time logs/updates may be provided via WebSocket in a future version. For now, poll /executions/{id}/logs.",
+})
+
+# Endpoints are plain `def` on purpose: the repository/service calls block on locks, so
+# Starlette runs them on the AnyIO threadpool. Only switch to `async def` if the body awaits.
+
 # PUBLIC_INTERFACE
 @router.get(
     "/readiness",
@@ -13,7 +23,7 @@ router = APIRouter(prefix="/monitoring", tags=["monitoring"])
 )
 def readiness():
     """Simple readiness endpoint used by orchestrators."""
-    return {"status": "ready"}
+    return Response(content=_READY_BODY, media_type="application/json")
 
 # PUBLIC_INTERFACE
 @router.get(
@@ -22,8 +32,9 @@ def readiness():
     summary="Service info and counters",
     description="Returns basic self-monitoring information: uptime and counts by state.",
 )
-def info(svc: ExecutionService = Depends(get_execution_service)):
+def info(request: Request):
     """Return service uptime and queue/running stats."""
+    svc: ExecutionService = request.app.state.svc
     stats = svc.stats()
     return MonitoringInfo(
         service="ExecutionService",
@@ -44,7 +55,4 @@ def websocket_docs():
     """
     Provide human-readable docs for future websocket endpoints for real-time logs/updates.
     """
-    return {
-        "websocket": "planned",
-        "note": "Real-time logs/updates may be provided via WebSocket in a future version. For now, poll /executions/{id}/logs.",
-    }
+    return Response(content=_WEBSOCKET_DOCS_BODY, media_type="application/json")
@@ -2,7 +2,7 @@ from __future__ import annotations
 from datetime import datetime
 from enum import Enum
 from typing import Dict, Optional, Any, List
-from pydantic import BaseModel, Field, HttpUrl
+from pydantic import BaseModel, ConfigDict, Field, HttpUrl
 
 class ExecutionEnvironment(str, Enum):
     LOCAL = "local"
@@ -20,6 +20,8 @@ class ExecutionStatus(str, Enum):
 # PUBLIC_INTERFACE
 class GitSource(BaseModel):
     """Git source inputs for cloning the repo and locating the script."""
+    model_config = ConfigDict(frozen=True)
+
     repository_url: HttpUrl = Field(..., description="HTTPS URL for the repository (GitLab/GitHub/Gerrit).")
     branch: Optional[str] = Field(None, description="Branch to checkout; default repository default.")
     commit_sha: Optional[str] = Field(None, description="Optional commit SHA for deterministic runs.")
@@ -31,6 +33,8 @@ class ExecutionRequest(BaseModel):
     Define an execution request with a git source, target script or entrypoint,
     parameters and selected environment.
     """
+    model_config = ConfigDict(frozen=True)
+
     git: GitSource = Field(..., description="Git repository location to fetch code from.")
     entrypoint: str = Field(..., description="Script or command to execute (e.g., path/to/script.py).")
     parameters: Dict[str, Any] = Field(default_factory=dict, description="Key/Value parameters to pass to the job.")
@@ -42,6 +46,8 @@ class ExecutionRequest(BaseModel):
 # PUBLIC_INTERFACE
 class ExecutionSummary(BaseModel):
     """Minimal execution metadata for listings."""
+    model_config = ConfigDict(frozen=True)
+
     execution_id: str = Field(..., description="Unique execution id.")
     status: ExecutionStatus = Field(..., description="Current status.")
     environment: ExecutionEnvironment = Field(..., description="Execution environment.")
@@ -62,6 +68,8 @@ class ExecutionDetail(ExecutionSummary):
 # PUBLIC_INTERFACE
 class LogsResponse(BaseModel):
     """Logs payload returned by the service."""
+    model_config = ConfigDict(frozen=True)
+
     execution_id: str = Field(..., description="Execution id associated with these logs.")
     lines: List[str] = Field(default_factory=list, description="Captured logs as lines.")
     next_offset: int = Field(0, description="Next offset for incremental fetching.")
@@ -70,12 +78,16 @@ class LogsResponse(BaseModel):
 # PUBLIC_INTERFACE
 class SubmitResponse(BaseModel):
     """Response returned after submitting an execution request."""
+    model_config = ConfigDict(frozen=True)
+
     execution_id: str = Field(..., description="Assigned execution id.")
     status: ExecutionStatus = Field(..., description="Initial status (typically queued).")
 
 # PUBLIC_INTERFACE
 class MonitoringInfo(BaseModel):
     """Self monitoring information returned by monitoring endpoints."""
+    model_config = ConfigDict(frozen=True)
+
     service: str = Field(..., description="Service name.")
     version: str = Field(..., description="Service version.")
     uptime_seconds: float = Field(..., description="Approximate uptime in seconds.")
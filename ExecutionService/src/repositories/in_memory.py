@@ -1,19 +1,119 @@
 from __future__ import annotations
+import asyncio
+import secrets
 import threading
+import time
+from array import array
 from datetime import datetime
-from typing import Dict, Optional, List, Tuple, Any
+from typing import Callable, Dict, Optional, List, Tuple, Any
+import orjson
 from ..models.schemas import ExecutionDetail, ExecutionStatus, ExecutionEnvironment, GitSource
 
+_SHARD_COUNT = 16
+
+_TERMINAL_STATUSES = frozenset((
+    ExecutionStatus.COMPLETED, ExecutionStatus.FAILED, ExecutionStatus.CANCELED, ExecutionStatus.TIMEOUT
+))
+
+# PUBLIC_INTERFACE
+def new_execution_id() -> str:
+    """
+    Generate a 32-hex-char execution id: a nanosecond timestamp followed by 64 random bits.
+    Ids sort lexicographically by creation time, unlike uuid4.
+    """
+    return f"{time.time_ns():016x}{secrets.token_hex(8)}"
+
+# PUBLIC_INTERFACE
+class LogNotifier:
+    """
+    Wakes coroutines waiting for new log activity on an execution.
+    Writers call notify() from any thread after publishing their change; waiters may live on
+    any event loop and are woken through call_soon_threadsafe.
+    """
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._waiters: Dict[str, List[Tuple[asyncio.AbstractEventLoop, asyncio.Event]]] = {}
+
+    # PUBLIC_INTERFACE
+    def notify(self, execution_id: str) -> None:
+        """Wake every waiter registered for the execution."""
+        # Unlocked fast path: a waiter registering concurrently re-checks its condition afterwards
+        if execution_id not in self._waiters:
+            return
+        with self._lock:
+            waiters = self._waiters.pop(execution_id, ())
+        for loop, event in waiters:
+            try:
+                loop.call_soon_threadsafe(event.set)
+            except RuntimeError:
+                # The waiter's loop has already been closed
+                pass
+
+    # PUBLIC_INTERFACE
+    async def wait(self, execution_id: str, ready: Callable[[], bool], timeout: float) -> bool:
+        """
+        Wait up to `timeout` seconds for a notify() on the execution unless `ready()` already holds.
+        Returns True when woken or ready, False on timeout.
+        """
+        waiter = (asyncio.get_running_loop(), asyncio.Event())
+        with self._lock:
+            self._waiters.setdefault(execution_id, []).append(waiter)
+        try:
+            # Checked after registering so a change published in between is not missed
+            if ready():
+                return True
+            await asyncio.wait_for(waiter[1].wait(), timeout)
+            return True
+        except asyncio.TimeoutError:
+            return False
+        finally:
+            with self._lock:
+                pending = self._waiters.get(execution_id)
+                if pending and waiter in pending:
+                    pending.remove(waiter)
+                    if not pending:
+                        del self._waiters[execution_id]
+
+class _Shard:
+    """One partition of the repository, guarded by its own lock."""
+    __slots__ = ("lock", "executions", "json", "log_buf", "log_idx")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.executions: Dict[str, ExecutionDetail] = {}
+        # Serialized form of each execution, rebuilt whenever the record is mutated.
+        self.json: Dict[str, bytes] = {}
+        # Logs are one newline-terminated utf-8 buffer per execution plus the byte offset where
+        # each line starts (with a trailing end offset), so a page is a pair of index lookups.
+        self.log_buf: Dict[str, bytearray] = {}
+        self.log_idx: Dict[str, array] = {}
+
+def _encode(detail: ExecutionDetail) -> bytes:
+    return orjson.dumps(detail.model_dump(mode="json"))
+
 class InMemoryExecutionRepository:
     """
     Thread-safe in-memory repository for executions and logs.
+    Records are partitioned across shards by execution id so that unrelated executions
+    do not contend on a single lock; status counters are maintained incrementally.
+    All locks are plain, non-reentrant threading.Lock: no method calls another lock-taking method
+    while holding the same lock (locked helpers expect the caller to hold it), the order lock is
+    never held together with another lock, and a shard lock is only ever taken before the stats lock.
     This is a placeholder. Replace with PostgreSQL-backed repository in future.
     """
     def __init__(self) -> None:
-        self._lock = threading.RLock()
-        self._executions: Dict[str, ExecutionDetail] = {}
-        self._logs: Dict[str, List[str]] = {}
+        self._shards: List[_Shard] = [_Shard() for _ in range(_SHARD_COUNT)]
+        self._order_lock = threading.Lock()
+        # Append-only: existing entries never move, so readers can walk a length snapshot unlocked
         self._created_order: List[str] = []
+        self._stats_lock = threading.Lock()
+        # Every status has a slot from the start, so updates never hit a missing key
+        self._counts: Dict[ExecutionStatus, int] = {st: 0 for st in ExecutionStatus}
+        self._counts_total = 0
+        self._log_notifier = LogNotifier()
+
+    def _shard(self, execution_id: str) -> _Shard:
+        return self._shards[hash(execution_id) % _SHARD_COUNT]
 
     # PUBLIC_INTERFACE
     def create_execution(
@@ -25,33 +125,97 @@ class InMemoryExecutionRepository:
         environment: ExecutionEnvironment,
         correlation_id: Optional[str],
     ) -> ExecutionDetail:
-        """Create and persist a new execution record with QUEUED status."""
-        with self._lock:
-            now = datetime.utcnow()
-            detail = ExecutionDetail(
-                execution_id=execution_id,
-                status=ExecutionStatus.QUEUED,
-                environment=environment,
-                created_at=now,
-                updated_at=now,
-                correlation_id=correlation_id,
-                git=git,
-                entrypoint=entrypoint,
-                parameters=parameters,
-                result=None,
-                error=None,
-                logs_pointer=f"mem:{execution_id}",
-            )
-            self._executions[execution_id] = detail
+        """
+        Create and persist a new execution record with QUEUED status.
+        Inputs arrive already validated at the API boundary, so the record is built with
+        model_construct and skips a second validation pass.
+        """
+        # One clock read serves both timestamps, taken before entering the critical section
+        now = datetime.utcnow()
+        detail = ExecutionDetail.model_construct(
+            execution_id=execution_id,
+            status=ExecutionStatus.QUEUED,
+            environment=environment,
+            created_at=now,
+            updated_at=now,
+            correlation_id=correlation_id,
+            git=git,
+            entrypoint=entrypoint,
+            # model_construct skips validation's copy; keep the caller's dict out of the record
+            parameters=dict(parameters),
+            result=None,
+            error=None,
+            logs_pointer=f"mem:{execution_id}",
+        )
+        encoded = _encode(detail)
+        shard = self._shard(execution_id)
+        with shard.lock:
+            shard.executions[execution_id] = detail
+            shard.json[execution_id] = encoded
+            shard.log_buf.setdefault(execution_id, bytearray())
+            shard.log_idx.setdefault(execution_id, array("Q", [0]))
+            # Counted before the shard lock is released, so an update_status on the new record
+            # can never decrement QUEUED ahead of this increment
+            with self._stats_lock:
+                self._counts_total += 1
+                self._counts[ExecutionStatus.QUEUED] += 1
+        with self._order_lock:
             self._created_order.append(execution_id)
-            self._logs.setdefault(execution_id, [])
-            return detail
+        return detail
+
+    # PUBLIC_INTERFACE
+    def contains(self, execution_id: str) -> bool:
+        """
+        Lock-free existence probe. A dict membership test is atomic under the GIL and records are
+        never removed, so a miss here is authoritative and unknown ids skip the shard lock.
+        """
+        return execution_id in self._shard(execution_id).executions
 
     # PUBLIC_INTERFACE
     def get_execution(self, execution_id: str) -> Optional[ExecutionDetail]:
         """Retrieve an execution by id."""
-        with self._lock:
-            return self._executions.get(execution_id)
+        shard = self._shard(execution_id)
+        with shard.lock:
+            return shard.executions.get(execution_id)
+
+    def _apply_status(
+        self,
+        shard: _Shard,
+        detail: ExecutionDetail,
+        status: ExecutionStatus,
+        result: Optional[Dict[str, Any]],
+        error: Optional[str],
+    ) -> ExecutionDetail:
+        """Swap in an updated copy of a frozen record. Caller holds the shard lock."""
+        previous = detail.status
+        # Stamped under the shard lock so updated_at follows the order updates are applied in
+        changes: Dict[str, Any] = {"status": status, "updated_at": datetime.utcnow()}
+        if result is not None:
+            changes["result"] = dict(result)
+        if error is not None:
+            changes["error"] = error
+        detail = detail.model_copy(update=changes)
+        shard.executions[detail.execution_id] = detail
+        shard.json[detail.execution_id] = _encode(detail)
+        if previous != status:
+            with self._stats_lock:
+                self._counts[previous] -= 1
+                self._counts[status] += 1
+        return detail
+
+    @staticmethod
+    def _append_lines(shard: _Shard, execution_id: str, lines: List[str]) -> None:
+        """Append encoded lines and their offsets. Caller holds the shard lock."""
+        buf = shard.log_buf.get(execution_id)
+        if buf is None:
+            buf = shard.log_buf[execution_id] = bytearray()
+            shard.log_idx[execution_id] = array("Q", [0])
+        idx = shard.log_idx[execution_id]
+        for line in lines:
+            # surrogatepass keeps lone surrogates (e.g. surrogateescape-decoded process output)
+            buf += line.encode("utf-8", "surrogatepass")
+            buf += b"\n"
+            idx.append(len(buf))
 
     # PUBLIC_INTERFACE
     def update_status(
@@ -62,25 +226,50 @@ class InMemoryExecutionRepository:
         error: Optional[str] = None,
     ) -> Optional[ExecutionDetail]:
         """Update the status/result/error and timestamp."""
-        with self._lock:
-            detail = self._executions.get(execution_id)
+        shard = self._shard(execution_id)
+        with shard.lock:
+            detail = shard.executions.get(execution_id)
             if not detail:
                 return None
-            detail.status = status
-            if result is not None:
-                detail.result = result
-            if error is not None:
-                detail.error = error
-            detail.updated_at = datetime.utcnow()
-            return detail
+            detail = self._apply_status(shard, detail, status, result, error)
+        # A terminal status ends the log stream, so long-polling readers must hear about it
+        self._log_notifier.notify(execution_id)
+        return detail
 
     # PUBLIC_INTERFACE
     def append_logs(self, execution_id: str, lines: List[str]) -> None:
         """Append log lines to an execution's log store."""
-        with self._lock:
-            if execution_id not in self._logs:
-                self._logs[execution_id] = []
-            self._logs[execution_id].extend(lines)
+        shard = self._shard(execution_id)
+        with shard.lock:
+            self._append_lines(shard, execution_id, lines)
+        self._log_notifier.notify(execution_id)
+
+    # PUBLIC_INTERFACE
+    def bulk_update(
+        self,
+        execution_id: str,
+        *,
+        status: Optional[ExecutionStatus] = None,
+        append_lines: Optional[List[str]] = None,
+        result: Optional[Dict[str, Any]] = None,
+        error: Optional[str] = None,
+    ) -> Optional[ExecutionDetail]:
+        """
+        Append log lines and/or update status/result/error within a single critical section.
+        Lines are appended before the status changes, so readers never see a terminal status
+        with logs still missing. Returns None if the execution does not exist.
+        """
+        shard = self._shard(execution_id)
+        with shard.lock:
+            detail = shard.executions.get(execution_id)
+            if not detail:
+                return None
+            if append_lines:
+                self._append_lines(shard, execution_id, append_lines)
+            if status is not None:
+                detail = self._apply_status(shard, detail, status, result, error)
+        self._log_notifier.notify(execution_id)
+        return detail
 
     # PUBLIC_INTERFACE
     def read_logs(self, execution_id: str, offset: int = 0, limit: int = 200) -> Tuple[List[str], int, bool]:
@@ -88,47 +277,81 @@ class InMemoryExecutionRepository:
         Read logs incrementally. Returns (lines, next_offset, eof).
         eof is true if execution is terminal and offset reached the end.
         """
-        with self._lock:
-            lines = self._logs.get(execution_id, [])
-            total = len(lines)
-            end = min(total, offset + limit)
-            slice_lines = lines[offset:end]
+        shard = self._shard(execution_id)
+        with shard.lock:
+            buf = shard.log_buf.get(execution_id)
+            if buf is None:
+                total = 0
+                end = 0
+                slice_lines: List[str] = []
+            else:
+                idx = shard.log_idx[execution_id]
+                total = len(idx) - 1
+                end = min(total, offset + limit)
+                with memoryview(buf) as view:
+                    # Drop the newline terminator of each line
+                    slice_lines = [str(view[idx[i]:idx[i + 1] - 1], "utf-8", "surrogatepass") for i in range(offset, end)]
 
             # eof when no more logs and execution terminal
-            detail = self._executions.get(execution_id)
-            terminal = detail is not None and detail.status in {
-                ExecutionStatus.COMPLETED, ExecutionStatus.FAILED, ExecutionStatus.CANCELED, ExecutionStatus.TIMEOUT
-            }
+            detail = shard.executions.get(execution_id)
+            terminal = detail is not None and detail.status in _TERMINAL_STATUSES
             eof = terminal and end >= total
             return slice_lines, end, eof
 
+    def _has_log_activity(self, execution_id: str, offset: int) -> bool:
+        """True if lines exist past `offset` or the execution is terminal."""
+        shard = self._shard(execution_id)
+        with shard.lock:
+            idx = shard.log_idx.get(execution_id)
+            if idx is not None and len(idx) - 1 > offset:
+                return True
+            detail = shard.executions.get(execution_id)
+            return detail is not None and detail.status in _TERMINAL_STATUSES
+
+    # PUBLIC_INTERFACE
+    async def wait_for_logs(self, execution_id: str, offset: int, timeout: float) -> bool:
+        """
+        Wait up to `timeout` seconds for log lines past `offset` or for the execution to finish.
+        Returns False if nothing happened before the timeout.
+        """
+        return await self._log_notifier.wait(
+            execution_id, lambda: self._has_log_activity(execution_id, offset), timeout
+        )
+
+    def _recent(self, limit: int, status: Optional[ExecutionStatus], serialized: bool) -> List[Any]:
+        """
+        Walk the creation order backwards and collect up to `limit` records matching `status`,
+        latest first. Returns the cached JSON blobs instead of the models when `serialized` is set.
+        """
+        records: List[Any] = []
+        order = self._created_order
+        # Only the length is read under the lock; a long filtered walk never blocks creation
+        with self._order_lock:
+            end = len(order)
+        for i in range(end - 1, -1, -1):
+            execution_id = order[i]
+            shard = self._shard(execution_id)
+            with shard.lock:
+                detail = shard.executions.get(execution_id)
+                if detail is None or (status and detail.status != status):
+                    continue
+                records.append(shard.json[execution_id] if serialized else detail)
+            if len(records) == limit:
+                break
+        return records
+
     # PUBLIC_INTERFACE
     def list_executions(self, limit: int = 50, status: Optional[ExecutionStatus] = None) -> List[ExecutionDetail]:
-        """List recent executions optionally filtered by status."""
-        with self._lock:
-            ids = list(self._created_order)[-limit:]
-            records = [self._executions[i] for i in ids if i in self._executions]
-            if status:
-                records = [r for r in records if r.status == status]
-            # Latest first
-            records.sort(key=lambda r: r.created_at, reverse=True)
-            return records
+        """List recent executions, latest first, optionally filtered by status."""
+        return self._recent(limit, status, serialized=False)
+
+    # PUBLIC_INTERFACE
+    def list_executions_json(self, limit: int = 50, status: Optional[ExecutionStatus] = None) -> bytes:
+        """Same as list_executions, but returns a ready-to-send JSON array built from cached blobs."""
+        return b"[" + b",".join(self._recent(limit, status, serialized=True)) + b"]"
 
     # PUBLIC_INTERFACE
     def stats(self) -> Dict[str, int]:
-        """Compute basic stats such as totals by state."""
-        with self._lock:
-            totals = {
-                "total": len(self._executions),
-                "queued": 0,
-                "running": 0,
-                "completed": 0,
-                "failed": 0,
-                "canceled": 0,
-                "timeout": 0,
-            }
-            for d in self._executions.values():
-                key = d.status.value
-                if key in totals:
-                    totals[key] += 1
-            return totals
+        """Return basic stats such as totals by state from the incremental counters."""
+        with self._stats_lock:
+            return {"total": self._counts_total, **{st.value: count for st, count in self._counts.items()}}
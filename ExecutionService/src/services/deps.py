@@ -5,5 +5,6 @@ from .execution_service import ExecutionService
 def get_execution_service() -> ExecutionService:
     """
     Creates or returns a singleton ExecutionService for the process.
+    The application binds it to app.state.svc at startup; endpoints read it from there.
     """
     return ExecutionService()
@@ -0,0 +1,23 @@
+import asyncio
+import logging
+
+from starlette.concurrency import run_in_threadpool
+
+logger = logging.getLogger(__name__)
+
+# PUBLIC_INTERFACE
+async def run_execution_worker(queue: asyncio.Queue) -> None:
+    """
+    Background consumer for submitted executions.
+    Each queue item is (service, execution_id, payload); the service's process() drives the
+    execution through its state transitions on the threadpool, off the request path.
+    Runs until cancelled.
+    """
+    while True:
+        svc, execution_id, payload = await queue.get()
+        try:
+            await run_in_threadpool(svc.process, execution_id, payload)
+        except Exception:
+            logger.exception("Execution %s failed while processing", execution_id)
+        finally:
+            queue.task_done()
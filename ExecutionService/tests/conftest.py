@@ -1,42 +1,54 @@
 import sys
 import types
 import time
-import uuid
+from datetime import datetime as _dt
 from typing import Dict, Optional, Any, List, Tuple
 
+import orjson
 import pytest
 from fastapi.testclient import TestClient
 
 # Import app and dependencies
 from src.api.main import app
+from src.repositories.in_memory import LogNotifier, new_execution_id
 from src.models.schemas import (
     ExecutionRequest,
     ExecutionDetail,
     ExecutionStatus,
     LogsResponse,
 )
-from src.services import deps as deps_module
+
+_TERMINAL_STATUSES = frozenset((
+    ExecutionStatus.COMPLETED,
+    ExecutionStatus.FAILED,
+    ExecutionStatus.CANCELED,
+    ExecutionStatus.TIMEOUT,
+))
 
 
 class _FakeRepo:
     """Simple in-memory store mimicking required repository operations for the fake service."""
+    _EMPTY_STATS = {"total": 0, "queued": 0, "running": 0, "completed": 0, "failed": 0, "canceled": 0, "timeout": 0}
+
     def __init__(self) -> None:
         self.executions: Dict[str, ExecutionDetail] = {}
         self.logs: Dict[str, List[str]] = {}
+        self.notifier = LogNotifier()
 
     def create(self, req: ExecutionRequest) -> ExecutionDetail:
-        eid = str(uuid.uuid4())
-        # Use datetime conversion via pydantic (construct with model values)
-        detail = ExecutionDetail(
+        eid = new_execution_id()
+        now = _dt.utcnow()
+        # Request fields are already validated; construct without re-running validators
+        detail = ExecutionDetail.model_construct(
             execution_id=eid,
             status=ExecutionStatus.QUEUED,
             environment=req.environment,
-            created_at=__import__("datetime").datetime.utcnow(),
-            updated_at=__import__("datetime").datetime.utcnow(),
+            created_at=now,
+            updated_at=now,
             correlation_id=req.correlation_id,
             git=req.git,
             entrypoint=req.entrypoint,
-            parameters=req.parameters,
+            parameters=dict(req.parameters),
             result=None,
             error=None,
             logs_pointer=f"mem:{eid}",
@@ -45,6 +57,9 @@ class _FakeRepo:
         self.logs[eid] = []
         return detail
 
+    def contains(self, execution_id: str) -> bool:
+        return execution_id in self.executions
+
     def get(self, execution_id: str) -> Optional[ExecutionDetail]:
         return self.executions.get(execution_id)
 
@@ -54,41 +69,70 @@ class _FakeRepo:
         d = self.executions.get(execution_id)
         if not d:
             return None
-        d.status = status
+        changes: Dict[str, Any] = {"status": status, "updated_at": _dt.utcnow()}
         if result is not None:
-            d.result = result
+            changes["result"] = dict(result)
         if error is not None:
-            d.error = error
-        d.updated_at = __import__("datetime").datetime.utcnow()
+            changes["error"] = error
+        d = d.model_copy(update=changes)
+        self.executions[execution_id] = d
+        self.notifier.notify(execution_id)
         return d
 
+    def seed(self, payload: ExecutionRequest) -> str:
+        """Test helper: store a QUEUED execution without enqueuing it for the background worker."""
+        return self._repo.create(payload).execution_id
+
     def append_logs(self, execution_id: str, lines: List[str]) -> None:
         self.logs.setdefault(execution_id, [])
         self.logs[execution_id].extend(lines)
+        self.notifier.notify(execution_id)
+
+    async def wait_for_logs(self, execution_id: str, offset: int, timeout: float) -> bool:
+        def ready() -> bool:
+            d = self.executions.get(execution_id)
+            return len(self.logs.get(execution_id, [])) > offset or (d is not None and d.status in _TERMINAL_STATUSES)
+        return await self.notifier.wait(execution_id, ready, timeout)
+
+    def apply_transition(
+        self, execution_id: str, lines: List[str], status: ExecutionStatus, result: Optional[Dict[str, Any]] = None
+    ) -> Optional[ExecutionDetail]:
+        """Append logs and move to `status` in one step (any transition), waking long-pollers once."""
+        d = self.executions.get(execution_id)
+        if not d:
+            return None
+        self.logs.setdefault(execution_id, []).extend(lines)
+        changes: Dict[str, Any] = {"status": status, "updated_at": _dt.utcnow()}
+        if result is not None:
+            changes["result"] = dict(result)
+        d = d.model_copy(update=changes)
+        self.executions[execution_id] = d
+        self.notifier.notify(execution_id)
+        return d
 
     def read_logs(self, execution_id: str, offset: int, limit: int) -> Tuple[List[str], int, bool]:
         lines = self.logs.get(execution_id, [])
         end = min(len(lines), offset + limit)
         slice_ = lines[offset:end]
         d = self.executions.get(execution_id)
-        terminal = d is not None and d.status in {
-            ExecutionStatus.COMPLETED,
-            ExecutionStatus.FAILED,
-            ExecutionStatus.CANCELED,
-            ExecutionStatus.TIMEOUT,
-        }
+        terminal = d is not None and d.status in _TERMINAL_STATUSES
         eof = terminal and end >= len(lines)
         return slice_, end, eof
 
     def list(self, limit: int, status: Optional[ExecutionStatus]) -> List[ExecutionDetail]:
-        arr = list(self.executions.values())
-        if status:
-            arr = [x for x in arr if x.status == status]
-        arr.sort(key=lambda x: x.created_at, reverse=True)
-        return arr[:limit]
+        # Ids are time-ordered and dicts keep insertion order, so walking backwards is latest first
+        arr: List[ExecutionDetail] = []
+        for x in reversed(self.executions.values()):
+            if status and x.status != status:
+                continue
+            arr.append(x)
+            if len(arr) == limit:
+                break
+        return arr
 
     def stats(self) -> Dict[str, int]:
-        res = {"total": len(self.executions), "queued": 0, "running": 0, "completed": 0, "failed": 0, "canceled": 0, "timeout": 0}
+        res = self._EMPTY_STATS.copy()
+        res["total"] = len(self.executions)
         for d in self.executions.values():
             key = d.status.value
             if key in res:
@@ -106,16 +150,25 @@ class FakeExecutionService:
     # PUBLIC_INTERFACE
     def submit(self, payload: ExecutionRequest):
         detail = self._repo.create(payload)
-        # Simulate that a QUEUED execution quickly transitions to RUNNING then COMPLETED with logs
-        self._repo.update_status(detail.execution_id, ExecutionStatus.RUNNING)
-        self._repo.append_logs(detail.execution_id, [f"Starting: {payload.entrypoint}", "Executing step 1", "Executing step 2"])
-        # Mark completed and add final log
-        self._repo.append_logs(detail.execution_id, ["Finished successfully"])
-        self._repo.update_status(detail.execution_id, ExecutionStatus.COMPLETED, result={"ok": True})
         # Return minimal response used by API
         from src.models.schemas import SubmitResponse
         return SubmitResponse(execution_id=detail.execution_id, status=ExecutionStatus.QUEUED)
 
+    # PUBLIC_INTERFACE
+    def process(self, execution_id: str, payload: ExecutionRequest) -> None:
+        # Simulate that a QUEUED execution quickly transitions to RUNNING then COMPLETED with logs
+        self._repo.apply_transition(
+            execution_id,
+            [f"Starting: {payload.entrypoint}", "Executing step 1", "Executing step 2"],
+            ExecutionStatus.RUNNING,
+        )
+        # Mark completed and add final log
+        self._repo.apply_transition(execution_id, ["Finished successfully"], ExecutionStatus.COMPLETED, result={"ok": True})
+
+    # PUBLIC_INTERFACE
+    def contains(self, execution_id: str) -> bool:
+        return self._repo.contains(execution_id)
+
     # PUBLIC_INTERFACE
     def get(self, execution_id: str) -> Optional[ExecutionDetail]:
         return self._repo.get(execution_id)
@@ -124,6 +177,11 @@ class FakeExecutionService:
     def list(self, limit: int = 50, status: Optional[ExecutionStatus] = None) -> List[ExecutionDetail]:
         return self._repo.list(limit=limit, status=status)
 
+    # PUBLIC_INTERFACE
+    def list_json(self, limit: int = 50, status: Optional[ExecutionStatus] = None) -> bytes:
+        blobs = [orjson.dumps(d.model_dump(mode="json")) for d in self.list(limit=limit, status=status)]
+        return b"[" + b",".join(blobs) + b"]"
+
     # PUBLIC_INTERFACE
     def logs(self, execution_id: str, offset: int = 0, limit: int = 200) -> Optional[LogsResponse]:
         d = self._repo.get(execution_id)
@@ -132,10 +190,22 @@ class FakeExecutionService:
         lines, next_offset, eof = self._repo.read_logs(execution_id, offset=offset, limit=limit)
         return LogsResponse(execution_id=execution_id, lines=lines, next_offset=next_offset, eof=eof)
 
+    # PUBLIC_INTERFACE
+    async def wait_for_logs(self, execution_id: str, offset: int, timeout: float) -> bool:
+        return await self._repo.wait_for_logs(execution_id, offset, timeout)
+
     # PUBLIC_INTERFACE
     def stats(self) -> Dict[str, int]:
         return self._repo.stats()
 
+    def seed(self, payload: ExecutionRequest) -> str:
+        """Test helper: store a QUEUED execution without enqueuing it for the background worker."""
+        return self._repo.create(payload).execution_id
+
+    def append_logs(self, execution_id: str, lines: List[str]) -> None:
+        """Test helper: emit log lines as a running execution would."""
+        self._repo.append_logs(execution_id, lines)
+
     # PUBLIC_INTERFACE
     def uptime_seconds(self) -> float:
         return time.time() - self._start_time
@@ -165,15 +235,13 @@ def stub_execution_service_module(fake_execution_service):
 @pytest.fixture
 def client(fake_execution_service: FakeExecutionService):
     """
-    Provides a TestClient with dependency override for get_execution_service to use our fake service instance.
+    Provides a TestClient with app.state.svc pointed at our fake service instance.
     """
-    # Override dependency
-    def _override():
-        return fake_execution_service
-    app.dependency_overrides[deps_module.get_execution_service] = _override
-
     with TestClient(app) as c:
+        # Startup binds the real service; swap in the fake once the lifespan has run
+        previous = app.state.svc
+        app.state.svc = fake_execution_service
         yield c
 
     # Cleanup
-    app.dependency_overrides.pop(deps_module.get_execution_service, None)
+    app.state.svc = previous
@@ -1,5 +1,11 @@
+import json
+import re
+import threading
+import time
+
 from fastapi.testclient import TestClient
 
+from src.api.main import app
 from src.models.schemas import GitSource, ExecutionRequest, ExecutionEnvironment, ExecutionStatus
 
 
@@ -22,6 +28,50 @@ def test_submit_execution_happy_path(client: TestClient):
     assert data["status"] == ExecutionStatus.QUEUED.value
 
 
+def test_submitted_execution_is_processed_in_background(client: TestClient):
+    payload = _sample_request().model_dump(mode="json")
+    exec_id = client.post("/executions", json=payload).json()["execution_id"]
+
+    deadline = time.monotonic() + 5
+    status = None
+    while time.monotonic() < deadline:
+        status = client.get(f"/executions/{exec_id}").json()["status"]
+        if status == ExecutionStatus.COMPLETED.value:
+            break
+        time.sleep(0.01)
+    assert status == ExecutionStatus.COMPLETED.value
+
+    logs = client.get(f"/executions/{exec_id}/logs").json()
+    assert logs["lines"][-1] == "Finished successfully"
+    assert logs["eof"] is True
+
+
+def test_submit_execution_invalid_body(client: TestClient):
+    r = client.post("/executions", json={"entrypoint": "scripts/run.py"})
+    assert r.status_code == 422
+    assert r.json()["detail"][0]["loc"] == ["body", "git"]
+
+    r2 = client.post("/executions", content=b"not json", headers={"content-type": "application/json"})
+    assert r2.status_code == 422
+
+    # Malformed JSON reports FastAPI's decode error with the failing position
+    r3 = client.post("/executions", content=b'{"git": 1', headers={"content-type": "application/json"})
+    assert r3.status_code == 422
+    err = r3.json()["detail"][0]
+    assert err["type"] == "json_invalid" and err["loc"] == ["body", 9] and err["msg"] == "JSON decode error"
+
+
+def test_submit_execution_rejects_non_json_content_type(client: TestClient):
+    body = json.dumps(_sample_request().model_dump(mode="json")).encode()
+    # text/plain is a CORS "simple" request (no preflight), so it must not create executions
+    r = client.post("/executions", content=body, headers={"content-type": "text/plain"})
+    assert r.status_code == 422
+    assert r.json()["detail"][0]["loc"] == ["body"]
+
+    r2 = client.post("/executions", content=body, headers={"content-type": "application/vnd.api+json; charset=utf-8"})
+    assert r2.status_code == 201
+
+
 def test_get_execution_detail_and_logs_flow(client: TestClient):
     # Submit
     payload = _sample_request().model_dump(mode="json")
@@ -85,3 +135,69 @@ def test_execution_not_found_errors(client: TestClient):
     assert r.status_code == 404
     r2 = client.get(f"/executions/{missing_id}/logs")
     assert r2.status_code == 404
+
+
+def test_logs_replace_lone_surrogates(client: TestClient, fake_execution_service):
+    exec_id = client.post("/executions", json=_sample_request().model_dump(mode="json")).json()["execution_id"]
+    fake_execution_service.append_logs(exec_id, ["bad \udcff byte"])
+
+    r = client.get(f"/executions/{exec_id}/logs?offset=0&limit=100")
+    assert r.status_code == 200
+    assert "bad \ufffd byte" in r.json()["lines"]
+
+
+def test_logs_long_poll_returns_on_eof(client: TestClient):
+    payload = _sample_request().model_dump(mode="json")
+    exec_id = client.post("/executions", json=payload).json()["execution_id"]
+
+    # Long-poll from offset 0 returns as soon as lines exist (or the execution finished)
+    r = client.get(f"/executions/{exec_id}/logs?offset=0&wait_ms=5000")
+    assert r.status_code == 200
+    logs = r.json()
+    assert logs["lines"] or logs["eof"]
+
+    r2 = client.get("/executions/does-not-exist/logs?wait_ms=100")
+    assert r2.status_code == 404
+
+
+def test_logs_long_poll_wakes_on_append_and_times_out(client: TestClient, fake_execution_service):
+    # Seeded rather than submitted so no background worker races the long-poll
+    exec_id = fake_execution_service.seed(_sample_request())
+
+    timer = threading.Timer(0.1, fake_execution_service.append_logs, args=(exec_id, ["late line"]))
+    timer.start()
+    started = time.monotonic()
+    r = client.get(f"/executions/{exec_id}/logs?offset=0&wait_ms=5000")
+    elapsed = time.monotonic() - started
+    timer.join()
+    assert r.status_code == 200
+    assert r.json()["lines"] == ["late line"]
+    assert r.json()["next_offset"] == 1
+    assert elapsed < 4
+
+    # Nothing arrives past the end: the wait times out and the empty page is returned
+    started = time.monotonic()
+    r2 = client.get(f"/executions/{exec_id}/logs?offset=1&wait_ms=200")
+    assert time.monotonic() - started >= 0.2
+    assert r2.status_code == 200
+    assert r2.json()["lines"] == []
+    assert r2.json()["next_offset"] == 1
+    assert r2.json()["eof"] is False
+
+
+def test_openapi_submit_contract():
+    schema = app.openapi()
+    components = schema["components"]["schemas"]
+    post = schema["paths"]["/executions"]["post"]
+
+    # Request body is published as a named component, as FastAPI derives it for typed bodies
+    assert post["requestBody"]["content"]["application/json"]["schema"] == {"$ref": "#/components/schemas/ExecutionRequest"}
+    assert set(components["ExecutionRequest"]["required"]) == {"git", "entrypoint"}
+    assert set(post["responses"]) == {"201", "400", "422"}
+    assert post["responses"]["422"]["content"]["application/json"]["schema"] == {
+        "$ref": "#/components/schemas/HTTPValidationError"
+    }
+
+    # Every reference in the document resolves to a published component
+    refs = re.findall(r'"\$ref": "#/components/schemas/([^"]+)"', json.dumps(schema))
+    assert refs and all(name in components for name in refs)
@@ -7,6 +7,13 @@ def test_health_root(client: TestClient):
     assert r.json() == {"message": "Healthy"}
 
 
+def test_cors_wildcard_does_not_allow_credentials(client: TestClient):
+    r = client.get("/", headers={"Origin": "https://ui.example.com"})
+    assert r.status_code == 200
+    assert r.headers["access-control-allow-origin"] == "*"
+    assert "access-control-allow-credentials" not in r.headers
+
+
 def test_readiness(client: TestClient):
     r = client.get("/monitoring/readiness")
     assert r.status_code == 200
@@ -1,4 +1,9 @@
-from src.repositories.in_memory import InMemoryExecutionRepository
+import asyncio
+import threading
+
+import orjson
+
+from src.repositories.in_memory import InMemoryExecutionRepository, new_execution_id
 from src.models.schemas import (
     ExecutionEnvironment,
     ExecutionStatus,
@@ -10,6 +15,18 @@ def _git():
     return GitSource(repository_url="https://example.com/repo.git", branch="main", subpath="scripts")
 
 
+def _create(repo, eid, **overrides):
+    fields = dict(
+        git=_git(),
+        entrypoint="run.py",
+        parameters={},
+        environment=ExecutionEnvironment.SIMULATED,
+        correlation_id=None,
+    )
+    fields.update(overrides)
+    return repo.create_execution(execution_id=eid, **fields)
+
+
 def test_create_and_get_and_list_and_stats():
     repo = InMemoryExecutionRepository()
     # Create
@@ -24,6 +41,7 @@ def test_create_and_get_and_list_and_stats():
     assert d1.execution_id == "e1"
     assert d1.status == ExecutionStatus.QUEUED
     assert repo.get_execution("e1") is not None
+    assert repo.contains("e1") and not repo.contains("nope")
 
     # Logs append and read pre-terminal -> eof False
     repo.append_logs("e1", ["line1", "line2", "line3"])
@@ -58,3 +76,89 @@ def test_create_and_get_and_list_and_stats():
     assert len(lst_all) == 2
     lst_completed = repo.list_executions(limit=10, status=ExecutionStatus.COMPLETED)
     assert all(x.status == ExecutionStatus.COMPLETED for x in lst_completed)
+
+
+def test_list_executions_latest_first_and_filter_before_limit():
+    repo = InMemoryExecutionRepository()
+    for i in range(5):
+        _create(repo, f"e{i}")
+    repo.update_status("e1", ExecutionStatus.COMPLETED)
+
+    assert [d.execution_id for d in repo.list_executions(limit=3)] == ["e4", "e3", "e2"]
+    # The status filter is applied while walking back, so older matches are still found
+    lst_completed = repo.list_executions(limit=3, status=ExecutionStatus.COMPLETED)
+    assert [d.execution_id for d in lst_completed] == ["e1"]
+
+
+def test_list_executions_json_tracks_updates():
+    repo = InMemoryExecutionRepository()
+    _create(repo, "e1", parameters={"x": 1})
+    repo.update_status("e1", ExecutionStatus.COMPLETED, result={"ok": True})
+
+    arr = orjson.loads(repo.list_executions_json(limit=10))
+    assert arr == [repo.get_execution("e1").model_dump(mode="json")]
+    assert arr[0]["status"] == ExecutionStatus.COMPLETED.value
+    assert orjson.loads(repo.list_executions_json(limit=10, status=ExecutionStatus.QUEUED)) == []
+
+
+def test_records_do_not_alias_caller_dicts():
+    repo = InMemoryExecutionRepository()
+    parameters = {"x": 1}
+    result = {"ok": True}
+    _create(repo, "e1", parameters=parameters)
+    repo.update_status("e1", ExecutionStatus.COMPLETED, result=result)
+    parameters["x"] = 2
+    result["ok"] = False
+
+    d = repo.get_execution("e1")
+    assert d.parameters == {"x": 1}
+    assert d.result == {"ok": True}
+
+
+def test_read_logs_preserves_line_content():
+    repo = InMemoryExecutionRepository()
+    repo.append_logs("e1", ["plain", "héllo ✓", "multi\nline", "", "bad \udcff byte"])
+    lines, next_offset, eof = repo.read_logs("e1", offset=1, limit=10)
+    assert lines == ["héllo ✓", "multi\nline", "", "bad \udcff byte"]
+    assert next_offset == 5
+    assert eof is False
+    # Reading past the end returns nothing
+    assert repo.read_logs("e1", offset=10, limit=5)[0] == []
+    assert repo.read_logs("missing")[0] == []
+
+
+def test_bulk_update_appends_and_transitions():
+    repo = InMemoryExecutionRepository()
+    assert repo.bulk_update("missing", status=ExecutionStatus.RUNNING) is None
+    _create(repo, "e1")
+    d = repo.bulk_update("e1", status=ExecutionStatus.COMPLETED, append_lines=["a", "b"], result={"ok": True})
+    assert d.status == ExecutionStatus.COMPLETED
+    assert d.result == {"ok": True}
+    assert repo.read_logs("e1") == (["a", "b"], 2, True)
+    stats = repo.stats()
+    assert stats["queued"] == 0 and stats["completed"] == 1
+
+
+def test_new_execution_id_is_time_ordered():
+    first = new_execution_id()
+    second = new_execution_id()
+    assert len(first) == 32 and int(first, 16) >= 0
+    assert first != second
+    assert first[:16] <= second[:16]
+
+
+def test_wait_for_logs_wakes_on_append_and_times_out():
+    repo = InMemoryExecutionRepository()
+    _create(repo, "e1")
+
+    async def scenario():
+        # Nothing arrives -> timeout
+        assert await repo.wait_for_logs("e1", offset=0, timeout=0.05) is False
+        # A writer thread appends while we wait -> woken well before the timeout
+        threading.Timer(0.05, repo.append_logs, args=("e1", ["hello"])).start()
+        assert await repo.wait_for_logs("e1", offset=0, timeout=5) is True
+        # Already past offset -> returns immediately
+        assert await repo.wait_for_logs("e1", offset=0, timeout=0) is True
+
+    asyncio.run(scenario())
+    assert repo.read_logs("e1")[0] == ["hello"]